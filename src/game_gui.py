@@ -1,3 +1,5 @@
+import heapq
+import operator
 import tkinter as tk
 from tkinter import ttk, messagebox
 from tkinter import scrolledtext
@@ -46,7 +48,7 @@ class GameGUI:
         self.log_text.config(state=tk.DISABLED)
 
     def get_top_grudge_wrestlers(self, count=2):
-        involved_wrestlers = set([
+        involved_wrestlers = frozenset((
             self.favored_var.get(),
             self.underdog_var.get(),
             self.favored_ally_var.get(),
@@ -55,11 +57,10 @@ class GameGUI:
             self.underdog_foe_var.get(),
             self.grudge1_var.get(),
             self.grudge2_var.get()
-        ])
+        ))
         
-        available_wrestlers = [w for w in self.game.wrestlers if w.name not in involved_wrestlers]
-        sorted_wrestlers = sorted(available_wrestlers, key=lambda w: w.grudge_grade, reverse=True)
-        return sorted_wrestlers[:count]
+        available_wrestlers = (w for w in self.game.wrestlers if w.name not in involved_wrestlers)
+        return heapq.nlargest(count, available_wrestlers, key=operator.attrgetter("grudge_grade"))
 
     def play_turn(self):
         if not self.game.favored_wrestler or not self.game.underdog_wrestler:
@@ -286,7 +287,7 @@ class GameGUI:
         if self.game.current_card:
             card = self.game.current_card
             card_text = f"Move Type: {card.type}\n"
-            if isinstance(card.points, dict):
+            if card.points_kind == "tv_grade_map":
                 card_text += "Points: Varies by TV Grade\n"
             else:
                 card_text += f"Points: {card.points}\n"
@@ -310,7 +311,7 @@ class GameGUI:
 
     def update_favored_wrestler(self, event):
         selected_name = self.favored_var.get()
-        self.game.favored_wrestler = next(w for w in self.game.wrestlers if w.name == selected_name)
+        self.game.favored_wrestler = self.game.get_wrestler(selected_name)
         self.update_display()
         self.update_hot_box_dropdowns()
 
@@ -378,7 +379,7 @@ class GameGUI:
 
     def update_underdog_wrestler(self, event):
         selected_name = self.underdog_var.get()
-        self.game.underdog_wrestler = next(w for w in self.game.wrestlers if w.name == selected_name)
+        self.game.underdog_wrestler = self.game.get_wrestler(selected_name)
         self.update_display()
         self.update_hot_box_dropdowns()
 
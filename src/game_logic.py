@@ -1,87 +1,265 @@
 import random
 import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from orjson import loads as json_loads  # Optional: parses the data files faster than json
+except ImportError:
+    from json import loads as json_loads
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+DECK_PATH = os.path.join(DATA_DIR, 'gamedata', 'fac_deck.json')
+WRESTLERS_PATH = os.path.join(DATA_DIR, 'wrestlers', 'wrestlers.json')
+
+# Cards resolved from the game book charts; no wrestler skill can score them
+TEXT_ONLY_CARD_TYPES = frozenset({"Ref Bump", "Wild Card", "Highlight Reel"})
+
+D6_FACES = (1, 2, 3, 4, 5, 6)
+D66_FACES = tuple(tens * 10 + ones for tens in D6_FACES for ones in D6_FACES)  # 11-16, 21-26, ... 61-66
+
+TV_GRADES = ('AAA', 'AA', 'A', 'B', 'C', 'D', 'E', 'F')  # Best to worst
+# (grade, other_grade) -> 1 if grade is better, -1 if worse, 0 if equal
+TV_GRADE_COMPARISON = {
+    (grade, other_grade): (i < j) - (i > j)
+    for i, grade in enumerate(TV_GRADES)
+    for j, other_grade in enumerate(TV_GRADES)
+}
+
+# Indexed by bool(card.control)
+CONTROL_LABELS = ("No Control", "Control")
+
+# Kick out ranges by TV grade
+PIN_RANGES = {
+    'AAA': range(11, 44),  # 11-43 inclusive
+    'AA': range(11, 37),   # 11-36 inclusive
+    'A': range(11, 34),    # 11-33 inclusive
+    'B': range(11, 27),    # 11-26 inclusive
+    'C': range(11, 24),    # 11-23 inclusive
+    'D': range(11, 17),    # 11-16 inclusive
+    'E': range(11, 14),    # 11-13 inclusive
+    'F': range(11, 12)     # 11 only
+}
+# Inclusive (low, high) bounds of each kick out range
+PIN_RANGE_BOUNDS = {grade: (r.start, r.stop - 1) for grade, r in PIN_RANGES.items()}
+
+# Board space type for each position 0-15 (PIN spaces are also SQUARE spaces for skills)
+SPACE_TYPES = (
+    "CIRCLE", "CIRCLE", "CIRCLE", "CIRCLE", "CIRCLE", "SQUARE", "CIRCLE", "SQUARE",
+    "CIRCLE", "SQUARE", "CIRCLE", "SQUARE", "PIN", "PIN", "PIN", "FINISHER",
+)
+
+# Card types every wrestler can score, whatever their skills or position
+ALWAYS_USABLE_SKILLS = frozenset({"tv", "grudge", "specialty"})
+# One bit per skill/card type key, so skill checks are a single AND; this table is never modified
+SKILL_BITS = {skill: 1 << i for i, skill in enumerate((
+    'tv', 'grudge', 'specialty', 'agile', 'cheat', 'favorite', 'heavy', 'helped',
+    'mean', 'object', 'powerful', 'quick', 'smart', 'strong',
+))}
+ALWAYS_USABLE_MASK = sum(SKILL_BITS[skill] for skill in ALWAYS_USABLE_SKILLS)
+
+# Bits handed out at load time to keys outside SKILL_BITS (e.g. "trailing", "wild card"); their
+# values depend on load order, so they only mean something within this process
+extra_skill_bits = {}
+
+def skill_bit(skill):
+    # Bit for a lowercase key, registering keys outside SKILL_BITS on first use
+    bit = SKILL_BITS.get(skill)
+    if bit is None:
+        bit = extra_skill_bits.setdefault(skill, 1 << (len(SKILL_BITS) + len(extra_skill_bits)))
+    return bit
+
+def known_skill_bit(skill):
+    # Bit already assigned to skill, as given or lowercased; 0 if none. Never registers a new key
+    return (SKILL_BITS.get(skill) or extra_skill_bits.get(skill)
+            or SKILL_BITS.get(skill.lower()) or extra_skill_bits.get(skill.lower(), 0))
+
+# Positions where a skill of each rating can be used; the FINISHER space (15) allows any skill
+SKILL_TYPE_POSITIONS = {
+    'star': frozenset(range(16)),
+    'square': frozenset({5, 7, 9, 11, 12, 13, 14, 15}),
+    'circle': frozenset({0, 1, 2, 3, 4, 6, 8, 10, 15}),
+}
+FINISHER_ONLY_POSITIONS = frozenset({15})
 
 class Card:
+    __slots__ = ('id', 'control', 'type', 'type_key', 'skill_bit', 'points', 'text', 'is_submission', 'points_kind',
+                 'grade_points')
+
     def __init__(self, id, control, type, points=None, text=None):
         self.id = id
         self.control = control
-        self.type = type
+        # Interned so comparisons against the string literals in the resolvers hit the identity fast path
+        self.type = sys.intern(type)
+        self.type_key = sys.intern(type.lower())  # Matches the lowercased keys in Wrestler.skills
+        self.skill_bit = skill_bit(self.type_key)
         self.points = points
         self.text = text
         self.is_submission = "Submission!" in (text or "")
+        # Classify points once so get_points and move_wrestler don't repeat the checks on every use
+        if type == "Specialty":  # Points come from the wrestler's specialty
+            self.points_kind = "specialty"
+        elif isinstance(points, dict):  # TV card
+            self.points_kind = "tv_grade_map"
+        elif points == "d6" or type == "Signature":
+            self.points_kind = "d6"
+        elif isinstance(points, (int, float)):
+            self.points_kind = "scalar"
+        else:
+            self.points_kind = "none"
+        # Points for each TV grade, for the kinds that don't depend on a roll or the wrestler's specialty
+        if self.points_kind in ("tv_grade_map", "scalar", "none"):
+            self.grade_points = {grade: self.get_points(grade) for grade in TV_GRADES}
+        else:
+            self.grade_points = {}
 
     def get_points(self, tv_grade=None):
-        if isinstance(self.points, dict):  # TV card
+        points_kind = self.points_kind
+        if points_kind == "scalar":
+            return self.points
+        elif points_kind == "tv_grade_map":
             return self.points.get(tv_grade, 0)
-        elif self.points == "d6":
+        elif points_kind == "d6":
             return random.randint(1, 6)
-        elif isinstance(self.points, (int, float)):
-            return self.points
         return 0
     
     def __str__(self):
-        return f"Card {self.id}: {self.type} ({'Control' if self.control else 'No Control'})"
+        return f"Card {self.id}: {self.type} ({CONTROL_LABELS[bool(self.control)]})"
+
+class DiceStream:
+    # Hands out d6 and d66 rolls from pre-rolled buffers that are refilled with a single rng.choices call
+    __slots__ = ('rng', 'size', 'buffer', 'd66_buffer')
+
+    def __init__(self, rng, size=256):
+        self.rng = rng
+        self.size = size
+        self.buffer = []
+        self.d66_buffer = []
+
+    def d6(self):
+        if not self.buffer:
+            self.buffer = self.rng.choices(D6_FACES, k=self.size)
+        return self.buffer.pop()
+
+    def d66(self):
+        if not self.d66_buffer:
+            self.d66_buffer = self.rng.choices(D66_FACES, k=self.size)
+        return self.d66_buffer.pop()
 
 class Game:
-    def __init__(self):
+    # File path -> (mtime, loaded data), shared by every Game in the process so batch runs skip the JSON reload
+    DATA_CACHE = {}
+
+    __slots__ = ('verbose', 'in_control_counter', 'in_control', 'favored_wrestler', 'underdog_wrestler',
+                 'wrestlers', 'wrestlers_by_name', 'deck', 'discard_pile', 'current_card', 'rng', 'dice',
+                 'card_resolvers', 'game_over', 'winner')
+
+    def __init__(self, verbose=True):
+        self.verbose = verbose  # When False, turns update state without building any log text (headless runs)
         self.in_control_counter = 0
         self.in_control = None  # Can be "Favored", "Underdog", or None
         self.favored_wrestler = None
         self.underdog_wrestler = None
         self.wrestlers = self.load_wrestlers()
+        self.wrestlers_by_name = {w.name: w for w in self.wrestlers}
         self.deck = []
         self.discard_pile = []
         self.current_card = None
-        self.load_and_shuffle_deck()
+        self.rng = random.Random()  # Per-game RNG for dice and deck shuffles
+        self.dice = DiceStream(self.rng)
+        # Card type_key -> resolver; anything not listed is resolved as a skill card
+        self.card_resolvers = {
+            "tv": self.resolve_tv_card,
+            "grudge": self.resolve_grudge_card,
+            "specialty": self.resolve_specialty_card,
+            "trailing": self.resolve_trailing_card,
+        }
+        # The deck is loaded by setup_game, or by the first draw_card when play starts without it
         self.game_over = False
+        self.winner = None
 
     def attempt_finisher(self, wrestler):
         if not wrestler.finisher:
             return f"{wrestler.name} doesn't have a finisher move defined."
         
-        result = f"{wrestler.name} attempts their finisher move: {wrestler.finisher['name']}!\n"
         roll = self.roll_d66()
+        low, high = wrestler.finisher['range']  # Normalised to an (int, int) tuple in Wrestler.__init__
+        if not self.verbose:
+            if low <= roll <= high:
+                self.game_over = True
+                self.winner = wrestler
+            else:
+                wrestler.position = 9
+            return ""
+
+        name = wrestler.name
+        result = f"{name} attempts their finisher move: {wrestler.finisher['name']}!\n"
         result += f"Dice roll: {roll}\n"
-        
-        if roll in range(wrestler.finisher['range'][0], wrestler.finisher['range'][1] + 1):
-            result += f"{wrestler.name}'s finisher is successful! They win the match!\n"
+        if low <= roll <= high:
+            result += f"{name}'s finisher is successful! They win the match!\n"
             self.game_over = True
+            self.winner = wrestler
         else:
-            result += f"{wrestler.name}'s finisher failed. They move back to position 9.\n"
+            result += f"{name}'s finisher failed. They move back to position 9.\n"
             wrestler.position = 9
         
         return result
 
     def attempt_pin(self):
-        pinner = max([self.favored_wrestler, self.underdog_wrestler], key=lambda w: w.position)
-        defender = self.underdog_wrestler if pinner == self.favored_wrestler else self.favored_wrestler
+        favored, underdog = self.favored_wrestler, self.underdog_wrestler
+        if favored.position >= underdog.position:  # Favored pins on a tie
+            pinner, defender = favored, underdog
+        else:
+            pinner, defender = underdog, favored
         
-        kick_out_range = self.get_pin_range(defender.tv_grade)
-        result = f"{pinner.name} attempts a pin on {defender.name}!\n"
-        result += f"{defender.name}'s kick out range (TV Grade {defender.tv_grade}): {kick_out_range.start}-{kick_out_range.stop - 1}\n"
+        low, high = PIN_RANGE_BOUNDS.get(defender.tv_grade, PIN_RANGE_BOUNDS['F'])
+        roll_d66 = self.dice.d66
+        if not self.verbose:
+            for count in range(3):
+                if low <= roll_d66() <= high:
+                    return ""
+            self.game_over = True
+            self.winner = pinner
+            return ""
+
+        defender_name = defender.name
+        parts = [
+            f"{pinner.name} attempts a pin on {defender_name}!\n",
+            f"{defender_name}'s kick out range (TV Grade {defender.tv_grade}): {low}-{high}\n",
+        ]
         
         for count in range(1, 4):
-            roll = self.roll_d66()
-            result += f"Count {count}: {defender.name} rolled {roll}\n"
+            roll = roll_d66()
+            parts.append(f"Count {count}: {defender_name} rolled {roll}\n")
             
-            if roll in kick_out_range:
-                result += f"{defender.name} kicks out at {count}!\n"
-                return result
+            if low <= roll <= high:
+                parts.append(f"{defender_name} kicks out at {count}!\n")
+                return "".join(parts)
         
-        result += f"{defender.name} fails to kick out. {pinner.name} wins by pinfall!\n"
+        parts.append(f"{defender_name} fails to kick out. {pinner.name} wins by pinfall!\n")
         self.game_over = True
-        return result
+        self.winner = pinner
+        return "".join(parts)
 
     def draw_card(self):
-        if not self.deck:
-            print("Deck is empty. Reshuffling discard pile.")
+        deck = self.deck
+        if deck:  # Usual case: one check, then draw
+            card = deck.pop()  # The end of the list is the top of the deck, so drawing is O(1)
+            self.discard_pile.append(card)
+            return card
+
+        if not self.discard_pile:
+            self.load_and_shuffle_deck()
+        else:
+            if self.verbose:  # Routine in long simulations; errors below are always printed
+                print("Deck is empty. Reshuffling discard pile.")
             self.deck = self.discard_pile
             self.discard_pile = []
-            random.shuffle(self.deck)
+            self.rng.shuffle(self.deck)
         
         if self.deck:
-            card = self.deck.pop(0)
+            card = self.deck.pop()
             self.discard_pile.append(card)
             return card
         else:
@@ -89,17 +267,15 @@ class Game:
             return None
 
     def get_pin_range(self, tv_grade):
-        ranges = {
-            'AAA': range(11, 44),  # 11-43 inclusive
-            'AA': range(11, 37),   # 11-36 inclusive
-            'A': range(11, 34),    # 11-33 inclusive
-            'B': range(11, 27),    # 11-26 inclusive
-            'C': range(11, 24),    # 11-23 inclusive
-            'D': range(11, 17),    # 11-16 inclusive
-            'E': range(11, 14),    # 11-13 inclusive
-            'F': range(11, 12)     # 11 only
-        }
-        return ranges.get(tv_grade, range(11, 12))  # Default to F range if not found
+        return PIN_RANGES.get(tv_grade, PIN_RANGES['F'])  # Default to F range if not found
+
+    def get_tiebreaker_winner(self):
+        # The wrestler further behind wins; favored wins ties
+        favored, underdog = self.favored_wrestler, self.underdog_wrestler
+        return underdog if underdog.position < favored.position else favored
+
+    def get_wrestler(self, name):
+        return self.wrestlers_by_name.get(name)
 
     def handle_d6_points(self, wrestler, card):
         roll = self.roll_d6()
@@ -107,100 +283,123 @@ class Game:
         return f"{wrestler.name} used {card.type} and moved to position {wrestler.position} (d6 roll: {roll})"
 
     def load_and_shuffle_deck(self):
-        file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'gamedata', 'fac_deck.json')
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            self.deck = [Card(**card) for card in data['cards']]
-            random.shuffle(self.deck)
+            # Cards are never modified during play, so the same instances can be reused across games
+            template = self.load_data_file(DECK_PATH, lambda data: tuple(Card(**card) for card in data['cards']))
+            self.deck = list(template)
+            self.rng.shuffle(self.deck)
         except FileNotFoundError:
-            print(f"Error: fac_deck.json not found at {file_path}")
+            print(f"Error: fac_deck.json not found at {DECK_PATH}")
             self.deck = []
         except json.JSONDecodeError:
-            print(f"Error: Invalid JSON in fac_deck.json")
+            print("Error: Invalid JSON in fac_deck.json")
             self.deck = []
 
+    def load_data_file(self, file_path, build):
+        # Parses a data file only when it has changed since the last load; later loads reuse build(data)
+        mtime = os.stat(file_path).st_mtime_ns
+        cached = Game.DATA_CACHE.get(file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with open(file_path, 'rb') as f:
+            value = build(json_loads(f.read()))
+        Game.DATA_CACHE[file_path] = (mtime, value)
+        return value
+
     def load_wrestlers(self):
-        file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'wrestlers', 'wrestlers.json')
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            return [Wrestler(game=self, **w) for w in data['wrestlers']]
+            roster = self.load_data_file(WRESTLERS_PATH, lambda data: data['wrestlers'])
         except FileNotFoundError:
-            print(f"Error: wrestlers.json not found at {file_path}")
+            print(f"Error: wrestlers.json not found at {WRESTLERS_PATH}")
             return []
         except json.JSONDecodeError:
-            print(f"Error: Invalid JSON in wrestlers.json")
+            print("Error: Invalid JSON in wrestlers.json")
             return []
+        # Wrestler.__init__ rewrites specialty/finisher in place, so each Game gets its own dict copies
+        return [Wrestler(game=self, **{k: dict(v) if isinstance(v, dict) else v for k, v in w.items()})
+                for w in roster]
 
     def move_wrestler(self, wrestler, card):
-        if card.type == "TV":
-            points = card.get_points(wrestler.tv_grade)
-        elif card.type == "Grudge":
-            points = card.get_points()  # Assuming Grudge cards have fixed points
-        elif card.type == "Specialty":
+        points_kind = card.points_kind
+        if points_kind == "specialty":
             points = wrestler.specialty_points
-        elif card.type == "Signature":
+        elif points_kind == "d6":
             points = self.roll_d6()
         else:
-            points = card.get_points(wrestler.tv_grade)
-        
-        if isinstance(points, str):
-            try:
-                points = int(points)
-            except ValueError:
-                if points == "d6":
-                    points = self.roll_d6()
-                else:
-                    points = 0  # Default to 0 if we can't convert to int
+            # TV cards look up the wrestler's grade; fixed-point cards (e.g. Grudge) ignore it
+            points = card.grade_points.get(wrestler.tv_grade)
+            if points is None:  # Grade outside TV_GRADES
+                points = card.get_points(wrestler.tv_grade)
         
         wrestler.score(points)
-        result = f"{wrestler.name} used {card.type} "
-        if card.type == "Specialty":
+        if points > 0:
+            self.in_control = wrestler
+        if not self.verbose:
+            return ""
+
+        name = wrestler.name
+        result = f"{name} used {card.type} "
+        if points_kind == "specialty":
             result += f"({wrestler.specialty.get('name', 'Unnamed Specialty')}) "
         result += f"and moved to position {wrestler.position} (+{points} points)"
-
         if points > 0:
-            self.in_control = wrestler
-            result += f"\n{wrestler.name} is now in control."
+            result += f"\n{name} is now in control."
         
         return result
 
+    def play_matches(self, favored, underdog, matches, max_turns=200):
+        # Plays headless matches on this Game, replacing its match state, so simulate_shard runs it on a
+        # fresh Game. Matches that run past max_turns count as "No Result"
+        self.favored_wrestler = favored
+        self.underdog_wrestler = underdog
+        results = {"Favored": 0, "Underdog": 0, "No Result": 0}
+        for _ in range(matches):
+            self.reset_match()
+            for _ in range(max_turns):
+                self.play_turn()
+                if self.game_over:
+                    break
+            if self.winner == favored:
+                results["Favored"] += 1
+            elif self.winner == underdog:
+                results["Underdog"] += 1
+            else:
+                results["No Result"] += 1
+        return results
+
     def play_turn(self):
-        initial_control = f"Current in control: {self.in_control.name if self.in_control else 'Neither'}"
+        verbose = self.verbose
+        in_control = self.in_control
+        if verbose:
+            initial_control = f"Current in control: {in_control.name if in_control else 'Neither'}"
         
-        self.current_card = self.draw_card()
-        if not self.current_card:
+        card = self.current_card = self.draw_card()
+        if not card:
             return "No cards available. Game cannot continue."
         
-        card_info = f"Card drawn: {self.current_card.type} ({'Control' if self.current_card.control else 'No Control'})"
-        result = self.resolve_card(self.current_card)
+        result = self.resolve_card(card)
+        in_control = self.in_control
         
-        new_control = f"New in control: {self.in_control.name if self.in_control else 'Neither'}"
-        
-        turn_result = f"{initial_control}\n{card_info}\n{result}\n{new_control}\n"
+        if verbose:
+            card_info = f"Card drawn: {card.type} ({CONTROL_LABELS[bool(card.control)]})"
+            new_control = f"New in control: {in_control.name if in_control else 'Neither'}"
+            # Lines are joined with newlines; the empty entry leaves a blank line before any pin/finisher text
+            turn_parts = [initial_control, card_info, result, new_control, ""]
         
         # Check for PIN or FINISHER opportunity only for the wrestler who just moved
-        active_wrestler = self.in_control  # Assuming the wrestler who just scored is now in control
-        if active_wrestler and active_wrestler.position in [12, 13, 14]:
+        active_wrestler = in_control  # Assuming the wrestler who just scored is now in control
+        space_type = SPACE_TYPES[active_wrestler.position] if active_wrestler else None
+        # attempt_pin/attempt_finisher set game_over and winner themselves when the match ends
+        if space_type == "PIN":
             pin_result = self.attempt_pin()
-            turn_result += f"\n{pin_result}"
-            if "wins by pinfall" in pin_result:
-                self.game_over = True
-                return turn_result
-        elif active_wrestler and active_wrestler.position == 15:
+            if verbose:
+                turn_parts.append(pin_result)
+        elif space_type == "FINISHER":
             finisher_result = self.attempt_finisher(active_wrestler)
-            turn_result += f"\n{finisher_result}"
-            if "They win the match" in finisher_result:
-                self.game_over = True
-                return turn_result
-        
-        # Check if any wrestler has moved beyond position 15
-        for wrestler in [self.favored_wrestler, self.underdog_wrestler]:
-            if wrestler.position > 15:
-                wrestler.position = 15
+            if verbose:
+                turn_parts.append(finisher_result)
         
-        return turn_result
+        return "\n".join(turn_parts) if verbose else ""
 
     def post_match_roll(self, winner):
         d6_roll = self.roll_d6()
@@ -221,43 +420,56 @@ class Game:
         else:
             return f"Pre-Match: Rolled d6: {d6_roll}, d66: {d66_roll}. Use Highlight Reel 'R'"
 
+    def reset_match(self):
+        for wrestler in (self.favored_wrestler, self.underdog_wrestler):
+            wrestler.position = 0
+            wrestler.last_card_scored = False
+        self.in_control = None
+        self.current_card = None
+        self.game_over = False
+        self.winner = None
+        # Gather the discards back into the deck rather than re-reading it from disk
+        self.deck.extend(self.discard_pile)
+        self.discard_pile = []
+        self.rng.shuffle(self.deck)
+
     def resolve_card(self, card):
-        result = f"Card drawn: {card.type} ({'Control' if card.control else 'No Control'})\n"
-
-        if card.control and self.in_control:
-            return result + self.resolve_in_control_card(card)
-
-        if card.type == "TV":
-            return result + self.resolve_tv_card(card)
-        elif card.type == "Grudge":
-            return result + self.resolve_grudge_card(card)
-        elif card.type == "Specialty":
-            return result + self.resolve_specialty_card(card)
-        elif card.type == "Trailing":
-            return result + self.resolve_trailing_card(card)
-        else:
-            return result + self.resolve_skill_card(card)
+        if card.type in TEXT_ONLY_CARD_TYPES:
+            return f"{card.text or card.type} No points scored." if self.verbose else ""
+
+        in_control = self.in_control
+        if card.control and in_control:
+            moved = self.move_wrestler(in_control, card)
+            return f"In-control card ({card.type}) for {in_control.name}:\n" + moved if self.verbose else ""
+
+        resolver = self.card_resolvers.get(card.type_key, self.resolve_skill_card)
+        return resolver(card)
 
     def resolve_grudge_card(self, card):
-        favored_grudge = self.favored_wrestler.grudge_grade
-        underdog_grudge = self.underdog_wrestler.grudge_grade
+        favored, underdog = self.favored_wrestler, self.underdog_wrestler
+        favored_grudge = favored.grudge_grade
+        underdog_grudge = underdog.grudge_grade
+        if not self.verbose:
+            if favored_grudge > underdog_grudge:
+                self.move_wrestler(favored, card)
+            elif underdog_grudge > favored_grudge:
+                self.move_wrestler(underdog, card)
+            else:
+                self.resolve_tiebreaker(card)
+            return ""
         
-        result = f"Comparing Grudge Grades: {self.favored_wrestler.name} ({favored_grudge}) vs {self.underdog_wrestler.name} ({underdog_grudge})\n"
+        parts = [f"Comparing Grudge Grades: {favored.name} ({favored_grudge}) vs {underdog.name} ({underdog_grudge})\n"]
         
         if favored_grudge > underdog_grudge:
-            result += self.move_wrestler(self.favored_wrestler, card)
+            parts.append(self.move_wrestler(favored, card))
         elif underdog_grudge > favored_grudge:
-            result += self.move_wrestler(self.underdog_wrestler, card)
+            parts.append(self.move_wrestler(underdog, card))
         else:
-            result += "Grudge Grades are equal. Using tiebreaker.\n"
-            result += self.resolve_tiebreaker(card)
+            parts.append("Grudge Grades are equal. Using tiebreaker.\n")
+            parts.append(self.resolve_tiebreaker(card))
         
-        return result
+        return "".join(parts)
 
-    def resolve_in_control_card(self, card):
-        result = f"In-control card ({card.type}) for {self.in_control.name}:\n"
-        return result + self.move_wrestler(self.in_control, card)
-    
     def resolve_signature_card(self, card):
         if self.in_control and self.in_control.last_card_scored:
             roll = self.roll_d6()
@@ -267,8 +479,18 @@ class Game:
             return "No wrestler eligible for Signature move. No points scored."
 
     def resolve_skill_card(self, card):
-        favored_can_use = self.favored_wrestler.can_use_skill(card.type, self.favored_wrestler.position)
-        underdog_can_use = self.underdog_wrestler.can_use_skill(card.type, self.underdog_wrestler.position)
+        favored, underdog = self.favored_wrestler, self.underdog_wrestler
+        skill = card.skill_bit
+        favored_can_use = bool(favored.usable_skills[favored.position] & skill)
+        underdog_can_use = bool(underdog.usable_skills[underdog.position] & skill)
+        if not (favored_can_use or underdog_can_use):
+            return "Neither wrestler can use this skill. No points scored."
+        if not self.verbose:
+            if favored_can_use and underdog_can_use:
+                self.resolve_tiebreaker(card)
+            else:
+                self.move_wrestler(favored if favored_can_use else underdog, card)
+            return ""
 
         result = f"Favored can use: {favored_can_use}\n"
         result += f"Underdog can use: {underdog_can_use}\n"
@@ -277,126 +499,137 @@ class Game:
             result += "Both wrestlers can use this skill.\n"
             result += self.resolve_tiebreaker(card)
         elif favored_can_use:
-            result += self.move_wrestler(self.favored_wrestler, card)
-        elif underdog_can_use:
-            result += self.move_wrestler(self.underdog_wrestler, card)
+            result += self.move_wrestler(favored, card)
         else:
-            result += "Neither wrestler can use this skill. No points scored."
+            result += self.move_wrestler(underdog, card)
 
         return result
 
     def resolve_specialty_card(self, card, in_control_wrestler=None):
-        result = "Specialty card drawn. "
-        
+        tiebreak = False
         if in_control_wrestler:
             if in_control_wrestler.has_specialty():
-                return result + self.move_wrestler(in_control_wrestler, card)
+                wrestler = in_control_wrestler
             else:
                 other_wrestler = self.underdog_wrestler if in_control_wrestler == self.favored_wrestler else self.favored_wrestler
-                if other_wrestler.has_specialty():
-                    return result + self.move_wrestler(other_wrestler, card)
-                else:
-                    return result + "Neither wrestler has a Specialty defined. No points scored."
-        
-        if self.favored_wrestler.has_specialty() and self.underdog_wrestler.has_specialty():
-            result += "Both wrestlers have specialties. Using tiebreaker.\n"
-            return result + self.resolve_tiebreaker(card)
-        elif self.favored_wrestler.has_specialty():
-            return result + self.move_wrestler(self.favored_wrestler, card)
-        elif self.underdog_wrestler.has_specialty():
-            return result + self.move_wrestler(self.underdog_wrestler, card)
+                wrestler = other_wrestler if other_wrestler.has_specialty() else None
         else:
-            return result + "Neither wrestler has a Specialty defined. No points scored."
+            favored, underdog = self.favored_wrestler, self.underdog_wrestler
+            favored_has_specialty = favored.has_specialty()
+            underdog_has_specialty = underdog.has_specialty()
+            if favored_has_specialty and underdog_has_specialty:
+                tiebreak = True
+                wrestler = self.get_tiebreaker_winner()
+            elif favored_has_specialty:
+                wrestler = favored
+            elif underdog_has_specialty:
+                wrestler = underdog
+            else:
+                wrestler = None
+
+        if wrestler is None:
+            return "Specialty card drawn. Neither wrestler has a Specialty defined. No points scored."
+        moved = self.move_wrestler(wrestler, card)
+        if not self.verbose:
+            return ""
+        if tiebreak:
+            return "Specialty card drawn. Both wrestlers have specialties. Using tiebreaker.\n" + moved
+        return "Specialty card drawn. " + moved
 
     def resolve_submission_card(self, card, wrestler):
-        result = f"{wrestler.name} attempts a submission move!\n"
-        points_scored = card.get_points(wrestler.tv_grade)
+        # Not reached from play_turn/resolve_card yet; kept for when submission cards are wired in
+        name = wrestler.name
+        parts = [f"{name} attempts a submission move!\n"]
+        # d6 cards roll from the game's dice buffer rather than Card.get_points' module-level randint
+        points_scored = self.roll_d6() if card.points_kind == "d6" else card.get_points(wrestler.tv_grade)
         wrestler.score(points_scored)
-        result += f"{wrestler.name} scores {points_scored} point(s). Position: {wrestler.position}\n"
+        parts.append(f"{name} scores {points_scored} point(s). Position: {wrestler.position}\n")
         
         opponent = self.underdog_wrestler if wrestler == self.favored_wrestler else self.favored_wrestler
-        opponent_is_strong = opponent.has_skill('strong') or opponent.has_skill('powerful')
+        break_hold = 4 if opponent.is_strong else 3
         
+        d6 = self.dice.d6
         while True:
-            roll = self.roll_d6()
-            break_hold = 3 if not opponent_is_strong else 4
+            roll = d6()
             if roll <= break_hold:
-                result += f"Opponent breaks the hold with a roll of {roll}.\n"
+                parts.append(f"Opponent breaks the hold with a roll of {roll}.\n")
                 break
-            else:
-                wrestler.score(1)
-                result += f"{wrestler.name} scores an additional point. Position: {wrestler.position}\n"
+            wrestler.score(1)
+            parts.append(f"{name} scores an additional point. Position: {wrestler.position}\n")
         
-        return result
+        return "".join(parts)
 
     def resolve_tiebreaker(self, card):
-        if self.favored_wrestler.position < self.underdog_wrestler.position:
-            return self.move_wrestler(self.favored_wrestler, card)
-        elif self.underdog_wrestler.position < self.favored_wrestler.position:
-            return self.move_wrestler(self.underdog_wrestler, card)
-        else:
-            return self.move_wrestler(self.favored_wrestler, card)  # Favored wins ties
+        return self.move_wrestler(self.get_tiebreaker_winner(), card)
 
     def resolve_trailing_card(self, card):
-        if self.favored_wrestler.is_trailing(self.underdog_wrestler):
-            return self.move_wrestler(self.favored_wrestler, card)
-        elif self.underdog_wrestler.is_trailing(self.favored_wrestler):
-            return self.move_wrestler(self.underdog_wrestler, card)
-        else:
-            return "Neither wrestler is trailing. No points scored."
+        # Same rule as Wrestler.is_trailing, inlined: the underdog counts as trailing on a tie
+        favored, underdog = self.favored_wrestler, self.underdog_wrestler
+        if favored.position < underdog.position:
+            return self.move_wrestler(favored, card)
+        return self.move_wrestler(underdog, card)
 
     def resolve_tv_card(self, card):
-        tv_grades = ['AAA', 'AA', 'A', 'B', 'C', 'D', 'E', 'F']
-        favored_grade = self.favored_wrestler.tv_grade
-        underdog_grade = self.underdog_wrestler.tv_grade
+        favored, underdog = self.favored_wrestler, self.underdog_wrestler
+        favored_grade = favored.tv_grade
+        underdog_grade = underdog.tv_grade
         
-        result = f"Comparing TV Grades: {self.favored_wrestler.name} ({favored_grade}) vs {self.underdog_wrestler.name} ({underdog_grade})\n"
+        comparison = TV_GRADE_COMPARISON[(favored_grade, underdog_grade)]
+        if not self.verbose:
+            if comparison > 0:
+                self.move_wrestler(favored, card)
+            elif comparison < 0:
+                self.move_wrestler(underdog, card)
+            else:
+                self.resolve_tiebreaker(card)
+            return ""
         
-        if tv_grades.index(favored_grade) < tv_grades.index(underdog_grade):
-            result += self.move_wrestler(self.favored_wrestler, card)
-        elif tv_grades.index(underdog_grade) < tv_grades.index(favored_grade):
-            result += self.move_wrestler(self.underdog_wrestler, card)
+        parts = [f"Comparing TV Grades: {favored.name} ({favored_grade}) vs {underdog.name} ({underdog_grade})\n"]
+        if comparison > 0:
+            parts.append(self.move_wrestler(favored, card))
+        elif comparison < 0:
+            parts.append(self.move_wrestler(underdog, card))
         else:
-            result += "TV Grades are equal. Using tiebreaker.\n"
-            result += self.resolve_tiebreaker(card)
+            parts.append("TV Grades are equal. Using tiebreaker.\n")
+            parts.append(self.resolve_tiebreaker(card))
         
-        return result
+        return "".join(parts)
 
     def resolve_wrestler_in_control(self, card, favored_has_skill, underdog_has_skill):
-        result = "Resolving In-Control card:\n"
-        if self.in_control:
-            result += f"Wrestler in control is {self.in_control.name}\n"
-            if (self.in_control == self.favored_wrestler and favored_has_skill) or \
-            (self.in_control == self.underdog_wrestler and underdog_has_skill):
-                result += self.move_wrestler(self.in_control, card)
+        parts = ["Resolving In-Control card:\n"]
+        in_control = self.in_control
+        if in_control:
+            parts.append(f"Wrestler in control is {in_control.name}\n")
+            if (in_control == self.favored_wrestler and favored_has_skill) or \
+            (in_control == self.underdog_wrestler and underdog_has_skill):
+                parts.append(self.move_wrestler(in_control, card))
             else:
                 new_card = self.draw_card()
-                result += f"{self.in_control.name} can't use {card.type}. New card drawn: {new_card.type}\n"
-                opponent = self.underdog_wrestler if self.in_control == self.favored_wrestler else self.favored_wrestler
-                if new_card.type.lower() in [skill.lower() for skill in opponent.skills]:
-                    result += self.move_wrestler(opponent, new_card)
+                parts.append(f"{in_control.name} can't use {card.type}. New card drawn: {new_card.type}\n")
+                opponent = self.underdog_wrestler if in_control == self.favored_wrestler else self.favored_wrestler
+                if new_card.skill_bit & opponent.skill_mask:
+                    parts.append(self.move_wrestler(opponent, new_card))
                 else:
-                    result += "Neither wrestler could use the In-Control exchange. Play continues."
+                    parts.append("Neither wrestler could use the In-Control exchange. Play continues.")
         else:
-            result += "No wrestler in control, resolving as a normal card.\n"
+            parts.append("No wrestler in control, resolving as a normal card.\n")
             if favored_has_skill and underdog_has_skill:
-                result += self.resolve_tiebreaker(card)
+                parts.append(self.resolve_tiebreaker(card))
             elif favored_has_skill:
-                result += self.move_wrestler(self.favored_wrestler, card)
+                parts.append(self.move_wrestler(self.favored_wrestler, card))
             elif underdog_has_skill:
-                result += self.move_wrestler(self.underdog_wrestler, card)
+                parts.append(self.move_wrestler(self.underdog_wrestler, card))
             else:
-                result += "Neither wrestler has this skill. No movement."
-        return result
+                parts.append("Neither wrestler has this skill. No movement.")
+        return "".join(parts)
 
     def roll_d6(self):
-        return random.randint(1, 6)
+        return self.dice.d6()
 
     def roll_d66(self):
-        return random.randint(1, 6) * 10 + random.randint(1, 6)
+        return self.dice.d66()
     
     def save_wrestlers(self):
-        file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'wrestlers', 'wrestlers.json')
         data = {"wrestlers": []}
         for wrestler in self.wrestlers:
             wrestler_data = {
@@ -417,8 +650,11 @@ class Game:
                 wrestler_data["finisher"]["range"] = list(wrestler_data["finisher"]["range"])
             data["wrestlers"].append(wrestler_data)
         
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)    
+        # json.dump escapes non-ASCII, so wrestler_editor can read the file in any locale encoding
+        with open(WRESTLERS_PATH, 'w') as f:
+            json.dump(data, f, indent=2)
+        Game.DATA_CACHE.pop(WRESTLERS_PATH, None)  # Next load picks up the saved grades
+
     def set_in_control(self, wrestler):
         if wrestler == self.favored_wrestler:
             self.in_control = "Favored"
@@ -428,6 +664,7 @@ class Game:
             self.in_control = None
 
     def set_wrestler_position(self, wrestler, position):
+        position = 0 if position < 0 else (15 if position > 15 else position)
         if wrestler == self.favored_wrestler:
             self.favored_wrestler.position = position
         elif wrestler == self.underdog_wrestler:
@@ -439,8 +676,27 @@ class Game:
             return
         self.load_and_shuffle_deck()
 
+    def simulate_matches(self, favored, underdog, matches, max_turns=200):
+        # Headless play for balance testing on a fresh Game, so this Game's match is left untouched
+        return simulate_shard(favored.name, underdog.name, matches, self.rng.getrandbits(64), max_turns)
+
+    def simulate_parallel(self, favored, underdog, matches, workers=None):
+        # Splits simulate_matches across worker processes, one seeded shard per worker
+        workers = workers or os.cpu_count() or 1
+        shard_sizes = [matches // workers + (i < matches % workers) for i in range(workers)]
+        results = {"Favored": 0, "Underdog": 0, "No Result": 0}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(simulate_shard, favored.name, underdog.name, size, self.rng.getrandbits(64))
+                for size in shard_sizes if size
+            ]
+            for future in futures:
+                for outcome, count in future.result().items():
+                    results[outcome] += count
+        return results
+
     def update_wrestler_grade(self, wrestler_name, grade_type, new_value):
-        wrestler = next((w for w in self.wrestlers if w.name == wrestler_name), None)
+        wrestler = self.get_wrestler(wrestler_name)
         if wrestler:
             old_value = wrestler.grudge_grade if grade_type.upper() == "GRUDGE" else wrestler.tv_grade
             if grade_type.upper() == "GRUDGE":
@@ -453,6 +709,10 @@ class Game:
         return f"Wrestler {wrestler_name} not found"
 
 class Wrestler:
+    __slots__ = ('game', 'name', 'sex', 'height', 'weight', 'hometown', 'tv_grade', 'grudge_grade',
+                 'skills', 'skill_mask', 'usable_skills', 'is_strong', 'specialty', 'finisher', 'image', 'position', 'last_card_scored',
+                 'is_title_holder')
+
     def __init__(self, game, name, sex, height, weight, hometown, tv_grade, grudge_grade, skills, specialty, finisher, image="placeholder.png"):
         self.game = game
         self.name = name
@@ -462,7 +722,15 @@ class Wrestler:
         self.hometown = hometown
         self.tv_grade = tv_grade
         self.grudge_grade = int(grudge_grade)
-        self.skills = {k.lower(): v.lower() for k, v in skills.items()}  # Convert skills to lowercase
+        self.skills = {sys.intern(k.lower()): sys.intern(v.lower()) for k, v in skills.items()}  # Convert skills to lowercase
+        # Skills don't change during a match, so build the skill masks once
+        self.skill_mask = sum(skill_bit(k) for k in self.skills)
+        skill_positions = [(skill_bit(k), SKILL_TYPE_POSITIONS.get(v, FINISHER_ONLY_POSITIONS)) for k, v in self.skills.items()]
+        self.usable_skills = tuple(
+            ALWAYS_USABLE_MASK | sum(bit for bit, positions in skill_positions if position in positions)
+            for position in range(16)
+        )
+        self.is_strong = bool(self.skill_mask & (SKILL_BITS['strong'] | SKILL_BITS['powerful']))  # STRONG and/or POWERFUL
         self.specialty = specialty
         if self.specialty and 'points' in self.specialty:
             try:
@@ -481,36 +749,24 @@ class Wrestler:
         self.is_title_holder = False  # Set this when appropriate
 
     def can_use_skill(self, skill, position):
-        skill = skill.lower()
-        if skill in ["tv", "grudge", "specialty"]:
-            return True
-        if skill in self.skills:
-            skill_type = self.skills[skill]
-            if position == 15:  # FINISHER space, all skills can be used
-                return True
-            elif skill_type == 'star':
-                return True
-            elif skill_type == 'square' and position in [5, 7, 9, 11, 12, 13, 14]:
-                return True
-            elif skill_type == 'circle' and position in [0, 1, 2, 3, 4, 6, 8, 10]:
-                return True
-        return False
+        # Card.type_key is already lowercase; other callers may pass the skill as written, e.g. 'Agile'
+        return bool(self.usable_skills[position] & known_skill_bit(skill))
 
     def has_skill(self, skill):
-        return skill.lower() in self.skills
+        return bool(self.skill_mask & known_skill_bit(skill))
 
     def has_specialty(self):
         return bool(self.specialty and self.specialty.get('name') and self.specialty.get('points'))
 
     def is_trailing(self, opponent):
-        return self.position < opponent.position or (self.position == opponent.position and self == self.game.underdog_wrestler)    
+        return self.position < opponent.position or (self.position == opponent.position and self is self.game.underdog_wrestler)
 
     def attempt_kickout(self):
-        kickout_range = self.game.get_pin_range(self.tv_grade)
+        low, high = PIN_RANGE_BOUNDS.get(self.tv_grade, PIN_RANGE_BOUNDS['F'])
         result = ""
         for attempt in range(3):
             roll = self.game.roll_d66()
-            kickout_success = roll in kickout_range
+            kickout_success = low <= roll <= high
             result += f"{self.name} kickout attempt {attempt + 1}: Rolled {roll} ({'Success' if kickout_success else 'Fail'})\n"
             if kickout_success:
                 result += f"{self.name} kicks out!\n"
@@ -519,10 +775,17 @@ class Wrestler:
         return result
 
     def score(self, points):
-        self.position += points
-        self.position = min(self.position, 15)
+        # Positions are capped at 15
+        self.position = min(self.position + points, 15)
         self.last_card_scored = True
 
     @property
     def specialty_points(self):
-        return int(self.specialty.get('points', 0))
\ No newline at end of file
+        return int(self.specialty.get('points', 0))
+
+def simulate_shard(favored_name, underdog_name, matches, seed, max_turns=200):
+    # Loads its own Game and plays the batch on it; used by simulate_matches and, per worker process,
+    # by simulate_parallel
+    game = Game(verbose=False)
+    game.rng.seed(seed)
+    return game.play_matches(game.get_wrestler(favored_name), game.get_wrestler(underdog_name), matches, max_turns)